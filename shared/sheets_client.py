@@ -1,7 +1,7 @@
 
 import gspread
 from google.oauth2.service_account import Credentials
-from gspread_formatting import set_frozen, format_cell_range, CellFormat, NumberFormat
+from gspread_formatting import set_frozen, format_cell_ranges, CellFormat, NumberFormat
 import pandas as pd
 from gspread.utils import rowcol_to_a1
 
@@ -33,16 +33,22 @@ def overwrite_with_dataframe(ws, df: pd.DataFrame):
     ws.update(values)
     set_frozen(ws, rows=1, cols=0)
     headers = list(df_clean.columns)
+    date_fmt = CellFormat(numberFormat=NumberFormat(type="DATE", pattern="yyyy-mm-dd"))
+    number_fmt = CellFormat(numberFormat=NumberFormat(type="NUMBER", pattern="0.00"))
+
+    # Collect column formats and send them in one batch request instead of one call per column
+    ranges = []
     for idx, col in enumerate(headers, start=1):
         sample = df_clean[col].dropna().head(1)
         if not sample.empty:
             v = sample.iloc[0]
             if hasattr(v, "to_pydatetime") or "date" in col.lower() or "week" in col.lower():
-                fmt = CellFormat(numberFormat=NumberFormat(type="DATE", pattern="yyyy-mm-dd"))
-                format_cell_range(ws, f"{rowcol_to_a1(2, idx)}:{rowcol_to_a1(10000, idx)}", fmt)
+                ranges.append((f"{rowcol_to_a1(2, idx)}:{rowcol_to_a1(10000, idx)}", date_fmt))
             elif isinstance(v, (int, float)):
-                fmt = CellFormat(numberFormat=NumberFormat(type="NUMBER", pattern="0.00"))
-                format_cell_range(ws, f"{rowcol_to_a1(2, idx)}:{rowcol_to_a1(10000, idx)}", fmt)
+                ranges.append((f"{rowcol_to_a1(2, idx)}:{rowcol_to_a1(10000, idx)}", number_fmt))
+
+    if ranges:
+        format_cell_ranges(ws, ranges)
 
 def append_to_worksheet(ws, df: pd.DataFrame):
     """
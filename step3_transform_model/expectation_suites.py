@@ -13,19 +13,111 @@ Each suite is crafted based on:
 - Data quality patterns observed in the datasets
 """
 
-from typing import Dict, List, Any, Optional
+import functools
+import inspect
+import logging
+import re
+import weakref
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple
+import pandas as pd
 import great_expectations as gx
 from great_expectations.core import ExpectationSuite
 from great_expectations.expectations.expectation_configuration import ExpectationConfiguration
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+
+# Placeholder for "today" in date bounds. Suite configs are built once and
+# cached, so the real date is substituted when a GX suite is created.
+# Date bounds are pd.Timestamp (not strings) so GX compares them natively
+# against datetime64 columns instead of parsing per row.
+TODAY = "__TODAY__"
+
+# Suite meta key recording the date TODAY was resolved to, so a suite built on
+# an earlier day is rebuilt instead of validating against a stale upper bound
+RESOLVED_DATE_META_KEY = "resolved_today"
+
+# Allowed values for the in-set expectations (frozensets for O(1) membership)
+LICENSE_STATUSES = frozenset({"ISSUED", "ACTIVE", "EXPIRED", "REVOKED", "SUSPENDED", "CANCELLED"})
+APPLICATION_TYPES = frozenset({"ISSUE", "RENEW", "C_LOC", "C_EXST"})  # Common types observed
+PERMIT_STATUSES = frozenset({"PERMIT ISSUED", "PERMIT FINALED", "PERMIT CANCELLED",
+                             "REVIEW PENDING", "APPLICATION INCOMPLETE"})
+WORK_TYPES = frozenset({"EASY PERMIT PROCESS", "PERMIT", "WIRING", "SIGN",
+                        "RENOVATION/ALTERATION", "NEW CONSTRUCTION"})
+STREET_DIRECTIONS = frozenset({"N", "S", "E", "W", "NE", "NW", "SE", "SW", None})
+
+# Regex expectations, compiled once. The dummy-name check uses an inline (?i)
+# flag so the case-insensitivity survives when GX receives the pattern string.
+ZIP_RE = re.compile(r"^60[678]\d{2}$")
+DUMMY_NAME_RE = re.compile(r"(?i)^(?:test|dummy)")
+
+# Shared, read-only meta flags. Definitions reference these instead of repeating
+# the literals; _materialize hands GX its own dict copy.
+_META_CRITICAL = MappingProxyType({"criticality": "critical"})
+_META_CHICAGO = MappingProxyType({"chicago_specific": True})
+
+logger = logging.getLogger(__name__)
+
+
+def _value_set_to_list(value_set: frozenset) -> List[Any]:
+    """Convert a value set to a list in a stable order (None last) for GX serialization."""
+    return sorted(value_set, key=lambda value: (value is None, value or ""))
+
+
+# GX 1.x names the expectation with ``type``; 0.x used ``expectation_type``
+_EXPECTATION_TYPE_ARG = (
+    "type" if "type" in inspect.signature(ExpectationConfiguration.__init__).parameters
+    else "expectation_type"
+)
+
+
+def _resolve_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn suite definition kwargs into the form GX expects.
+
+    Returns a copy when anything needs substituting; the definition is never mutated.
+    """
+    # GX serializes kwargs to JSON, which needs a list rather than a frozenset
+    if isinstance(kwargs.get("value_set"), frozenset):
+        kwargs = {**kwargs, "value_set": _value_set_to_list(kwargs["value_set"])}
+
+    # Regex expectations take the pattern string
+    if isinstance(kwargs.get("regex"), re.Pattern):
+        kwargs = {**kwargs, "regex": kwargs["regex"].pattern}
+
+    return kwargs
+
+
+def _materialize(definitions: Tuple[Dict[str, Any], ...]) -> Tuple[ExpectationConfiguration, ...]:
+    """Build the ExpectationConfiguration objects for a suite definition."""
+    return tuple(
+        ExpectationConfiguration(
+            **{_EXPECTATION_TYPE_ARG: definition["expectation_type"]},
+            kwargs=_resolve_kwargs(definition["kwargs"]),
+            meta=dict(definition.get("meta", {}))
+        )
+        for definition in definitions
+    )
+
+
+def _resolve_today(config: ExpectationConfiguration, today: pd.Timestamp) -> ExpectationConfiguration:
+    """Return the configuration with the TODAY placeholder replaced, copying only when needed."""
+    if config.kwargs.get("max_value") != TODAY:
+        return config
+    return ExpectationConfiguration(
+        **{_EXPECTATION_TYPE_ARG: getattr(config, _EXPECTATION_TYPE_ARG)},
+        kwargs={**config.kwargs, "max_value": today},
+        meta=config.meta
+    )
+
 
 class ChicagoSMBExpectationSuites:
     """Pre-built expectation suites for Chicago SMB datasets."""
 
     @staticmethod
-    def create_business_licenses_suite() -> List[Dict[str, Any]]:
+    @functools.lru_cache(maxsize=1)
+    def create_business_licenses_suite() -> Tuple[ExpectationConfiguration, ...]:
         """Create comprehensive expectations for Business Licenses dataset."""
-        return [
+        return _materialize((
             # Table-level expectations
             {
                 "expectation_type": "expect_table_row_count_to_be_between",
@@ -38,12 +130,19 @@ class ChicagoSMBExpectationSuites:
                 }
             },
 
-            # Core identifier expectations
+            # Required columns, checked together in one schema expectation
             {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "id"},
-                "meta": {"criticality": "critical"}
+                "expectation_type": "expect_table_columns_to_match_set",
+                "kwargs": {
+                    "column_set": ["id", "legal_name", "license_description", "community_area",
+                                   "community_area_name", "license_start_date", "license_status",
+                                   "application_type", "address"],
+                    "exact_match": False  # Extra columns are allowed
+                },
+                "meta": {**_META_CRITICAL, "notes": "Core business license fields must be present"}
             },
+
+            # Core identifier expectations
             {
                 "expectation_type": "expect_column_values_to_be_unique",
                 "kwargs": {"column": "id"},
@@ -52,15 +151,10 @@ class ChicagoSMBExpectationSuites:
             {
                 "expectation_type": "expect_column_values_to_not_be_null",
                 "kwargs": {"column": "id"},
-                "meta": {"criticality": "critical"}
+                "meta": _META_CRITICAL
             },
 
             # Business information expectations
-            {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "legal_name"},
-                "meta": {"criticality": "critical"}
-            },
             {
                 "expectation_type": "expect_column_values_to_not_be_null",
                 "kwargs": {"column": "legal_name"},
@@ -72,11 +166,6 @@ class ChicagoSMBExpectationSuites:
                 "meta": {"notes": "Reasonable business name length"}
             },
 
-            {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "license_description"},
-                "meta": {"criticality": "critical"}
-            },
             {
                 "expectation_type": "expect_column_values_to_not_be_null",
                 "kwargs": {"column": "license_description"},
@@ -84,22 +173,12 @@ class ChicagoSMBExpectationSuites:
             },
 
             # Geographic expectations - Critical for Chicago SMB analysis
-            {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "community_area"},
-                "meta": {"criticality": "critical", "chicago_specific": True}
-            },
             {
                 "expectation_type": "expect_column_values_to_be_between",
                 "kwargs": {"column": "community_area", "min_value": 1, "max_value": 77},
-                "meta": {"notes": "Chicago has exactly 77 community areas", "chicago_specific": True}
+                "meta": {**_META_CHICAGO, "notes": "Chicago has exactly 77 community areas"}
             },
 
-            {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "community_area_name"},
-                "meta": {"criticality": "critical", "chicago_specific": True}
-            },
             {
                 "expectation_type": "expect_column_values_to_not_be_null",
                 "kwargs": {"column": "community_area_name"},
@@ -110,34 +189,29 @@ class ChicagoSMBExpectationSuites:
             {
                 "expectation_type": "expect_column_values_to_be_between",
                 "kwargs": {"column": "latitude", "min_value": 41.6, "max_value": 42.1},
-                "meta": {"notes": "Chicago latitude bounds", "chicago_specific": True}
+                "meta": {**_META_CHICAGO, "notes": "Chicago latitude bounds"}
             },
             {
                 "expectation_type": "expect_column_values_to_be_between",
                 "kwargs": {"column": "longitude", "min_value": -87.9, "max_value": -87.5},
-                "meta": {"notes": "Chicago longitude bounds", "chicago_specific": True}
+                "meta": {**_META_CHICAGO, "notes": "Chicago longitude bounds"}
             },
 
             # Ward validation (Chicago has 50 wards)
             {
                 "expectation_type": "expect_column_values_to_be_between",
                 "kwargs": {"column": "ward", "min_value": 1, "max_value": 50},
-                "meta": {"notes": "Chicago has 50 wards", "chicago_specific": True}
+                "meta": {**_META_CHICAGO, "notes": "Chicago has 50 wards"}
             },
 
             # ZIP code expectations
             {
                 "expectation_type": "expect_column_values_to_match_regex",
-                "kwargs": {"column": "zip_code", "regex": r"^(606|607|608)\d{2}$"},
-                "meta": {"notes": "Chicago ZIP codes start with 606, 607, or 608", "chicago_specific": True}
+                "kwargs": {"column": "zip_code", "regex": ZIP_RE},
+                "meta": {**_META_CHICAGO, "notes": "Chicago ZIP codes start with 606, 607, or 608"}
             },
 
             # Date field expectations
-            {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "license_start_date"},
-                "meta": {"criticality": "critical"}
-            },
             {
                 "expectation_type": "expect_column_values_to_not_be_null",
                 "kwargs": {"column": "license_start_date"},
@@ -152,49 +226,39 @@ class ChicagoSMBExpectationSuites:
                 "expectation_type": "expect_column_values_to_be_between",
                 "kwargs": {
                     "column": "license_start_date",
-                    "min_value": "2000-01-01",
-                    "max_value": datetime.now().strftime("%Y-%m-%d")
+                    "min_value": pd.Timestamp("2000-01-01"),
+                    "max_value": TODAY
                 },
                 "meta": {"notes": "Reasonable date range for business licenses"}
             },
 
             # Business rule: start date should be before expiration date
             {
-                "expectation_type": "expect_column_pair_values_to_be_in_set",
+                "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
                 "kwargs": {
-                    "column_A": "license_start_date",
-                    "column_B": "expiration_date",
-                    "value_pairs_set": "start_before_expiration"  # Custom validation
+                    "column_A": "expiration_date",
+                    "column_B": "license_start_date",
+                    "or_equal": True
                 },
                 "meta": {"notes": "Business logic: start date must precede expiration"}
             },
 
             # License status expectations
-            {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "license_status"},
-                "meta": {"criticality": "critical"}
-            },
             {
                 "expectation_type": "expect_column_values_to_be_in_set",
                 "kwargs": {
                     "column": "license_status",
-                    "value_set": ["ISSUED", "ACTIVE", "EXPIRED", "REVOKED", "SUSPENDED", "CANCELLED"]
+                    "value_set": LICENSE_STATUSES
                 },
                 "meta": {"notes": "Standard license status values"}
             },
 
             # Application type validation
-            {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "application_type"},
-                "meta": {"criticality": "high"}
-            },
             {
                 "expectation_type": "expect_column_values_to_be_in_set",
                 "kwargs": {
                     "column": "application_type",
-                    "value_set": ["ISSUE", "RENEW", "C_LOC", "C_EXST"]  # Common types observed
+                    "value_set": APPLICATION_TYPES
                 },
                 "meta": {"notes": "Standard application types in Chicago system"}
             },
@@ -202,16 +266,11 @@ class ChicagoSMBExpectationSuites:
             # Data quality expectations
             {
                 "expectation_type": "expect_column_values_to_not_match_regex",
-                "kwargs": {"column": "legal_name", "regex": r"^(test|TEST|dummy|DUMMY)"},
+                "kwargs": {"column": "legal_name", "regex": DUMMY_NAME_RE},
                 "meta": {"notes": "Exclude test/dummy records from analysis"}
             },
 
             # Address validation
-            {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "address"},
-                "meta": {"criticality": "high"}
-            },
             {
                 "expectation_type": "expect_column_values_to_not_be_null",
                 "kwargs": {"column": "address"},
@@ -221,13 +280,14 @@ class ChicagoSMBExpectationSuites:
                 "expectation_type": "expect_column_value_lengths_to_be_between",
                 "kwargs": {"column": "address", "min_value": 5, "max_value": 200},
                 "meta": {"notes": "Reasonable address length"}
-            }
-        ]
+            },
+        ))
 
     @staticmethod
-    def create_building_permits_suite() -> List[Dict[str, Any]]:
+    @functools.lru_cache(maxsize=1)
+    def create_building_permits_suite() -> Tuple[ExpectationConfiguration, ...]:
         """Create expectations for Building Permits dataset."""
-        return [
+        return _materialize((
             # Table-level expectations
             {
                 "expectation_type": "expect_table_row_count_to_be_between",
@@ -235,23 +295,23 @@ class ChicagoSMBExpectationSuites:
                 "meta": {"notes": "Building permits dataset size validation"}
             },
 
-            # Core identifiers
+            # Required columns, checked together in one schema expectation
             {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "id"},
-                "meta": {"criticality": "critical"}
+                "expectation_type": "expect_table_columns_to_match_set",
+                "kwargs": {
+                    "column_set": ["id", "permit_", "permit_status", "permit_type", "issue_date"],
+                    "exact_match": False  # Extra columns are allowed
+                },
+                "meta": {**_META_CRITICAL, "notes": "Core building permit fields must be present"}
             },
+
+            # Core identifiers
             {
                 "expectation_type": "expect_column_values_to_be_unique",
                 "kwargs": {"column": "id"},
                 "meta": {"notes": "Primary key uniqueness"}
             },
 
-            {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "permit_"},
-                "meta": {"criticality": "critical"}
-            },
             {
                 "expectation_type": "expect_column_values_to_not_be_null",
                 "kwargs": {"column": "permit_"},
@@ -259,27 +319,16 @@ class ChicagoSMBExpectationSuites:
             },
 
             # Permit status validation
-            {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "permit_status"},
-                "meta": {"criticality": "critical"}
-            },
             {
                 "expectation_type": "expect_column_values_to_be_in_set",
                 "kwargs": {
                     "column": "permit_status",
-                    "value_set": ["PERMIT ISSUED", "PERMIT FINALED", "PERMIT CANCELLED",
-                                "REVIEW PENDING", "APPLICATION INCOMPLETE"]
+                    "value_set": PERMIT_STATUSES
                 },
                 "meta": {"notes": "Standard permit status values"}
             },
 
             # Permit type validation
-            {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "permit_type"},
-                "meta": {"criticality": "high"}
-            },
             {
                 "expectation_type": "expect_column_values_to_not_be_null",
                 "kwargs": {"column": "permit_type"},
@@ -287,11 +336,6 @@ class ChicagoSMBExpectationSuites:
             },
 
             # Date validations
-            {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "issue_date"},
-                "meta": {"criticality": "critical"}
-            },
             {
                 "expectation_type": "expect_column_values_to_be_of_type",
                 "kwargs": {"column": "issue_date", "type_": "datetime64"},
@@ -301,8 +345,8 @@ class ChicagoSMBExpectationSuites:
                 "expectation_type": "expect_column_values_to_be_between",
                 "kwargs": {
                     "column": "issue_date",
-                    "min_value": "1980-01-01",  # Reasonable historical range
-                    "max_value": datetime.now().strftime("%Y-%m-%d")
+                    "min_value": pd.Timestamp("1980-01-01"),  # Reasonable historical range
+                    "max_value": TODAY
                 },
                 "meta": {"notes": "Issue dates within reasonable range"}
             },
@@ -318,7 +362,7 @@ class ChicagoSMBExpectationSuites:
             {
                 "expectation_type": "expect_column_values_to_be_between",
                 "kwargs": {"column": "community_area", "min_value": 1, "max_value": 77},
-                "meta": {"notes": "Chicago community areas (1-77)", "chicago_specific": True}
+                "meta": {**_META_CHICAGO, "notes": "Chicago community areas (1-77)"}
             },
 
             # Financial field validations - All fees should be non-negative
@@ -351,8 +395,7 @@ class ChicagoSMBExpectationSuites:
                 "expectation_type": "expect_column_values_to_be_in_set",
                 "kwargs": {
                     "column": "work_type",
-                    "value_set": ["EASY PERMIT PROCESS", "PERMIT", "WIRING", "SIGN",
-                                "RENOVATION/ALTERATION", "NEW CONSTRUCTION"]
+                    "value_set": WORK_TYPES
                 },
                 "meta": {"notes": "Standard work types in Chicago permits"}
             },
@@ -362,16 +405,17 @@ class ChicagoSMBExpectationSuites:
                 "expectation_type": "expect_column_values_to_be_in_set",
                 "kwargs": {
                     "column": "street_direction",
-                    "value_set": ["N", "S", "E", "W", "NE", "NW", "SE", "SW", None]
+                    "value_set": STREET_DIRECTIONS
                 },
-                "meta": {"notes": "Standard street directions", "chicago_specific": True}
-            }
-        ]
+                "meta": {**_META_CHICAGO, "notes": "Standard street directions"}
+            },
+        ))
 
     @staticmethod
-    def create_cta_boardings_suite() -> List[Dict[str, Any]]:
+    @functools.lru_cache(maxsize=1)
+    def create_cta_boardings_suite() -> Tuple[ExpectationConfiguration, ...]:
         """Create expectations for CTA Boardings dataset."""
-        return [
+        return _materialize((
             # Table-level expectations
             {
                 "expectation_type": "expect_table_row_count_to_be_between",
@@ -379,12 +423,17 @@ class ChicagoSMBExpectationSuites:
                 "meta": {"notes": "CTA data should have substantial daily records"}
             },
 
-            # Service date validation
+            # Required columns, checked together in one schema expectation
             {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "service_date"},
-                "meta": {"criticality": "critical"}
+                "expectation_type": "expect_table_columns_to_match_set",
+                "kwargs": {
+                    "column_set": ["service_date", "total_rides"],
+                    "exact_match": False  # Extra columns are allowed
+                },
+                "meta": {**_META_CRITICAL, "notes": "Core CTA ridership fields must be present"}
             },
+
+            # Service date validation
             {
                 "expectation_type": "expect_column_values_to_be_unique",
                 "kwargs": {"column": "service_date"},
@@ -393,7 +442,7 @@ class ChicagoSMBExpectationSuites:
             {
                 "expectation_type": "expect_column_values_to_not_be_null",
                 "kwargs": {"column": "service_date"},
-                "meta": {"criticality": "critical"}
+                "meta": _META_CRITICAL
             },
             {
                 "expectation_type": "expect_column_values_to_be_of_type",
@@ -404,22 +453,17 @@ class ChicagoSMBExpectationSuites:
                 "expectation_type": "expect_column_values_to_be_between",
                 "kwargs": {
                     "column": "service_date",
-                    "min_value": "2010-01-01",  # CTA data availability
-                    "max_value": datetime.now().strftime("%Y-%m-%d")
+                    "min_value": pd.Timestamp("2010-01-01"),  # CTA data availability
+                    "max_value": TODAY
                 },
                 "meta": {"notes": "CTA data within reasonable historical range"}
             },
 
             # Total rides validation
-            {
-                "expectation_type": "expect_column_to_exist",
-                "kwargs": {"column": "total_rides"},
-                "meta": {"criticality": "critical"}
-            },
             {
                 "expectation_type": "expect_column_values_to_not_be_null",
                 "kwargs": {"column": "total_rides"},
-                "meta": {"criticality": "critical"}
+                "meta": _META_CRITICAL
             },
             {
                 "expectation_type": "expect_column_values_to_be_of_type",
@@ -453,100 +497,138 @@ class ChicagoSMBExpectationSuites:
                     "max_value": 1500000
                 },
                 "meta": {"notes": "99th percentile within expected range"}
-            }
-        ]
+            },
+        ))
 
     @staticmethod
-    def get_all_suites() -> Dict[str, List[Dict[str, Any]]]:
+    def get_all_suites() -> Dict[str, Tuple[ExpectationConfiguration, ...]]:
         """Get all pre-built expectation suites."""
-        return {
-            "business_licenses": ChicagoSMBExpectationSuites.create_business_licenses_suite(),
-            "building_permits": ChicagoSMBExpectationSuites.create_building_permits_suite(),
-            "cta_boardings": ChicagoSMBExpectationSuites.create_cta_boardings_suite()
-        }
+        return dict(_SUITES)
 
     @staticmethod
     def create_gx_suite_from_config(dataset_name: str, context) -> Optional[ExpectationSuite]:
         """Create a Great Expectations suite from the pre-built configuration."""
-        suite_configs = ChicagoSMBExpectationSuites.get_all_suites()
-
-        if dataset_name not in suite_configs:
-            print(f"❌ No pre-built suite for dataset: {dataset_name}")
+        if dataset_name not in _SUITES:
+            logger.error("No pre-built suite for dataset: %s", dataset_name)
             return None
 
         try:
             # Create expectation suite
             suite_name = f"{dataset_name}_chicago_smb_suite"
 
-            # Delete existing suite if it exists
-            try:
-                context.delete_expectation_suite(suite_name)
-            except:
-                pass
-
-            suite = context.create_expectation_suite(suite_name)
+            # Configurations are prebuilt; only the date-bounded ones are copied
+            today = pd.Timestamp(date.today())
+            exp_configs = [_resolve_today(config, today) for config in _SUITES[dataset_name]]
+            expectations_added = len(exp_configs)
 
-            # Add expectations from configuration
-            expectations_added = 0
-            config_list = suite_configs[dataset_name]
+            suite_meta = {RESOLVED_DATE_META_KEY: today.date().isoformat()}
 
-            for expectation_config in config_list:
-                expectation_type = expectation_config["expectation_type"]
-                kwargs = expectation_config["kwargs"]
-                meta = expectation_config.get("meta", {})
-
-                # Create expectation configuration
-                exp_config = ExpectationConfiguration(
-                    expectation_type=expectation_type,
-                    kwargs=kwargs,
-                    meta=meta
+            if hasattr(context, "add_or_update_expectation_suite"):
+                # Single store round-trip: replaces any existing suite of the same name
+                suite = context.add_or_update_expectation_suite(
+                    expectation_suite_name=suite_name,
+                    expectations=exp_configs,
+                    meta=suite_meta
                 )
-
-                # Add to suite
-                suite.add_expectation(exp_config)
-                expectations_added += 1
-
-            # Save suite
-            context.save_expectation_suite(suite)
-
-            print(f"✅ Created {suite_name} with {expectations_added} expectations")
+            else:
+                # Delete existing suite if it exists
+                try:
+                    context.delete_expectation_suite(suite_name)
+                except:
+                    pass
+
+                suite = context.create_expectation_suite(suite_name)
+                suite.meta.update(suite_meta)
+
+                # Add all expectations in one bulk call
+                if hasattr(suite, "add_expectation_configurations"):
+                    suite.add_expectation_configurations(exp_configs)
+                else:
+                    suite.expectations = exp_configs
+
+                # Save suite
+                context.save_expectation_suite(suite)
+
+            logger.info("Created %s with %d expectations", suite_name, expectations_added)
             return suite
 
         except Exception as e:
-            print(f"❌ Failed to create suite for {dataset_name}: {e}")
+            logger.error("Failed to create suite for %s: %s", dataset_name, e)
             return None
 
+# Suite configurations are built once at import and shared (as tuples) by every caller
+_SUITES: Dict[str, Tuple[ExpectationConfiguration, ...]] = {
+    "business_licenses": ChicagoSMBExpectationSuites.create_business_licenses_suite(),
+    "building_permits": ChicagoSMBExpectationSuites.create_building_permits_suite(),
+    "cta_boardings": ChicagoSMBExpectationSuites.create_cta_boardings_suite()
+}
+
+# Pandas data assets already registered, per context and then by dataset name.
+# Weakly keyed so a discarded context (and its assets) is not kept alive, and a
+# new context can never pick up assets cached for an old one at the same address.
+_DATASOURCE_CACHE: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+def _get_pandas_asset(context, dataset_name: str):
+    """Return the pandas data asset for a dataset, registering it on first use."""
+    assets = _DATASOURCE_CACHE.setdefault(context, {})
+    asset = assets.get(dataset_name)
+    if asset is None:
+        if hasattr(context.sources, "add_or_update_pandas"):
+            datasource = context.sources.add_or_update_pandas(dataset_name)
+        else:
+            datasource = context.sources.add_pandas(dataset_name)
+        asset = datasource.add_asset(dataset_name)
+        assets[dataset_name] = asset
+    return asset
+
+
+def _suite_is_current(context, suite_name: str) -> bool:
+    """Whether the stored suite exists and its TODAY bound was resolved today."""
+    if hasattr(context, "list_expectation_suite_names"):
+        if suite_name not in context.list_expectation_suite_names():
+            return False
+        suite = context.get_expectation_suite(suite_name)
+    else:
+        # GX 1.x keeps suites in the context.suites store, which raises when missing
+        try:
+            suite = context.suites.get(suite_name)
+        except Exception:
+            return False
+    return (suite.meta or {}).get(RESOLVED_DATE_META_KEY) == date.today().isoformat()
+
+
 # Convenience functions
 def create_all_chicago_suites(context) -> Dict[str, ExpectationSuite]:
     """Create all Chicago SMB expectation suites."""
     suites = {}
     dataset_names = ["business_licenses", "building_permits", "cta_boardings"]
 
-    print("🏗️  CREATING CHICAGO SMB EXPECTATION SUITES")
-    print("=" * 50)
+    logger.info("Creating Chicago SMB expectation suites")
 
     for dataset_name in dataset_names:
         suite = ChicagoSMBExpectationSuites.create_gx_suite_from_config(dataset_name, context)
         if suite:
             suites[dataset_name] = suite
 
-    print(f"\n✅ Created {len(suites)}/{len(dataset_names)} expectation suites")
+    logger.info("Created %d/%d expectation suites", len(suites), len(dataset_names))
     return suites
 
 def validate_chicago_dataset(df, dataset_name: str, context) -> Dict[str, Any]:
     """Validate a Chicago dataset using pre-built expectations."""
-    # Ensure suite exists
-    suite = ChicagoSMBExpectationSuites.create_gx_suite_from_config(dataset_name, context)
-    if not suite:
-        return {"error": f"Could not create suite for {dataset_name}"}
+    suite_name = f"{dataset_name}_chicago_smb_suite"
 
     try:
+        # Ensure suite exists and is current (rebuilt on first use and once per day)
+        if not _suite_is_current(context, suite_name):
+            suite = ChicagoSMBExpectationSuites.create_gx_suite_from_config(dataset_name, context)
+            if not suite:
+                return {"error": f"Could not create suite for {dataset_name}"}
+
         # Create validator and run validation
         validator = context.get_validator(
-            batch_request=context.sources.add_pandas(dataset_name).add_asset(
-                dataset_name
-            ).build_batch_request(dataframe=df),
-            expectation_suite_name=suite.expectation_suite_name
+            batch_request=_get_pandas_asset(context, dataset_name).build_batch_request(dataframe=df),
+            expectation_suite_name=suite_name
         )
 
         results = validator.validate()
@@ -575,8 +657,8 @@ if __name__ == "__main__":
         print(f"  Expectations: {len(suite_config)}")
 
         # Count by criticality
-        critical = sum(1 for exp in suite_config if exp.get("meta", {}).get("criticality") == "critical")
-        chicago_specific = sum(1 for exp in suite_config if exp.get("meta", {}).get("chicago_specific", False))
+        critical = sum(1 for exp in suite_config if exp.meta.get("criticality") == "critical")
+        chicago_specific = sum(1 for exp in suite_config if exp.meta.get("chicago_specific", False))
 
         print(f"  Critical: {critical}")
         print(f"  Chicago-specific: {chicago_specific}")
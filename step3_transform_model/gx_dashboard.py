@@ -5,16 +5,96 @@ Provides dashboard utilities and alerting mechanisms for monitoring
 the Great Expectations data cleaning pipeline health and performance.
 """
 
+import bisect
+import csv
 import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
 import logging
 
+# Metrics filenames (metrics_<YYYYmmddTHHMMSS>_<execution_id>.json, so a sorted
+# directory listing is chronological) are defined by the writer in gx_monitoring
+try:
+    from .gx_monitoring import METRICS_TIMESTAMP_FORMAT, TIMESTAMPED_METRICS_RE
+except ImportError:
+    from gx_monitoring import METRICS_TIMESTAMP_FORMAT, TIMESTAMPED_METRICS_RE
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Columns written by export_metrics_to_csv, followed by error/warning counts
+EXPORT_COLUMNS = [
+    'timestamp', 'dataset_name', 'execution_id', 'status', 'duration_seconds',
+    'input_rows', 'output_rows', 'input_columns', 'output_columns',
+    'transformations_attempted', 'transformations_successful', 'transformation_success_rate',
+]
+
+# Per-execution fields aggregated by check_alerts
+SUMMARY_COLUMNS = ['timestamp', 'dataset_name', 'status', 'duration_seconds', 'transformation_success_rate']
+
+# Actionable recommendations for each alert type
+ALERT_RECOMMENDATIONS = {
+    'LOW_SUCCESS_RATE': (
+        "🔧 Review failed pipeline executions and check data source quality",
+        "📊 Consider adjusting transformation expectations for problematic fields",
+    ),
+    'SLOW_PERFORMANCE': (
+        "⚡ Consider optimizing data processing for large datasets",
+        "🧪 Test with smaller data samples to identify bottlenecks",
+    ),
+    'LOW_TRANSFORMATION_RATE': (
+        "🎯 Review desired schema definitions for accuracy",
+        "📋 Check if new data patterns require schema updates",
+    ),
+    'REPEATED_FAILURES': (
+        "🚨 URGENT: Investigate root cause of pipeline failures",
+        "🛡️ Consider implementing fallback data processing",
+    ),
+    'NO_DATA': (
+        "📈 Verify pipeline scheduling and execution",
+        "🔍 Check for system-level issues preventing execution",
+    ),
+}
+
+
+def _metrics_frame(records: List[Dict]) -> pd.DataFrame:
+    """Build a DataFrame of the summary columns used for alerting from metrics records."""
+    return pd.DataFrame(records, columns=SUMMARY_COLUMNS)
+
+
+def _metrics_epoch(data: Dict) -> float:
+    """Start time of a metrics record as epoch seconds, or NaN if it has none."""
+    epoch = data.get('timestamp_epoch')
+    if epoch is not None:
+        return epoch
+
+    # Records written before timestamp_epoch existed only carry the ISO timestamp
+    try:
+        return datetime.fromisoformat(data['timestamp']).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return np.nan
+
+
+def _cutoff_name(cutoff_time: datetime) -> str:
+    """Metrics filename prefix that sorts at the cutoff time."""
+    return f"metrics_{cutoff_time.strftime(METRICS_TIMESTAMP_FORMAT)}"
+
+
+def _read_metrics_file(path: str) -> Optional[bytes]:
+    """Read a metrics file's raw bytes, or return None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError as e:
+        logger.warning(f"⚠️ Could not read metrics file {path}: {e}")
+        return None
+
 class GXDashboard:
     """
     Dashboard and alerting system for GX pipeline monitoring.
@@ -26,6 +106,17 @@ class GXDashboard:
     - Historical trend analysis
     """
 
+    # Files modified this long before the cutoff are skipped without opening
+    # them (metrics files are write-once); the margin absorbs clock skew.
+    MTIME_GUARD_SECONDS = 3600
+
+    # The parsed-metrics index keeps files from this many hours back (the
+    # export window), or from a longer window while one is being read
+    INDEX_RETENTION_HOURS = 168
+
+    # Alert levels by ordinal severity (index 0 = GREEN, 2 = RED)
+    _SEVERITY_NAMES = ('GREEN', 'YELLOW', 'RED')
+
     def __init__(self, monitoring_directory: str = "data/monitoring"):
         """
         Initialize the dashboard system.
@@ -34,6 +125,9 @@ class GXDashboard:
             monitoring_directory: Directory containing monitoring data
         """
         self.monitoring_dir = Path(monitoring_directory)
+        self._index_path = self.monitoring_dir / "_metrics_index.json"
+        self._index_cache: Optional[Tuple[int, Dict[str, Tuple[float, Dict]]]] = None
+        self._window_cache: Dict[int, Tuple[Tuple[int, int], Tuple[List[Dict], np.ndarray, pd.DataFrame]]] = {}
         self.alert_thresholds = {
             'min_success_rate': 70.0,          # Minimum transformation success rate
             'max_duration_seconds': 60.0,      # Maximum acceptable pipeline duration
@@ -41,40 +135,240 @@ class GXDashboard:
             'max_error_rate': 10.0,            # Maximum acceptable error rate
         }
 
-    def load_recent_metrics(self, hours: int = 24) -> List[Dict]:
-        """Load metrics from recent pipeline executions."""
+    def _load_index(self) -> Dict[str, Tuple[float, Dict]]:
+        """
+        Load the parsed-metrics index ({filename: (mtime, metrics)}) from disk.
+
+        The index is plain JSON, since the monitoring directory is shared and
+        its contents are not trusted. The decoded index is kept in memory until
+        the file changes, so it is only parsed again after another process
+        rewrites it.
+        """
+        try:
+            index_mtime_ns = os.stat(self._index_path).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+
+        if self._index_cache is not None and self._index_cache[0] == index_mtime_ns:
+            return self._index_cache[1]
+
+        try:
+            with open(self._index_path, 'r') as f:
+                raw_index = json.load(f)
+            index = {name: (float(mtime), data) for name, (mtime, data) in raw_index.items()}
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable metrics index {self._index_path}: {e}")
+            return {}
+
+        self._index_cache = (index_mtime_ns, index)
+        return index
+
+    def _save_index(self, index: Dict[str, Tuple[float, Dict]]):
+        """
+        Write the parsed-metrics index atomically.
+
+        Each writer uses its own temporary file, so dashboards in different
+        processes never interleave writes before the rename.
+        """
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile('w', dir=self._index_path.parent, prefix='.metrics_index.',
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                json.dump(index, f, default=str)
+            os.replace(tmp_path, self._index_path)
+            tmp_path = None
+            self._index_cache = (os.stat(self._index_path).st_mtime_ns, index)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write metrics index {self._index_path}: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def _list_metrics_files(self) -> Tuple[Dict[str, os.DirEntry], List[str], List[str]]:
+        """
+        List the metrics files in the monitoring directory.
+
+        Returns:
+            (entries by name, timestamped names in sorted order, legacy names)
+        """
+        try:
+            entries = {
+                entry.name: entry for entry in os.scandir(self.monitoring_dir)
+                if entry.name.startswith("metrics_") and entry.name.endswith(".json")
+            }
+        except FileNotFoundError:
+            return {}, [], []
+
+        timestamped = sorted(name for name in entries if TIMESTAMPED_METRICS_RE.match(name))
+        legacy = [name for name in entries if not TIMESTAMPED_METRICS_RE.match(name)]
+        return entries, timestamped, legacy
+
+    def _scan_metrics(self, cutoff_time: datetime,
+                      listing: Tuple[Dict[str, os.DirEntry], List[str], List[str]]) -> Dict[str, Tuple[float, Dict]]:
+        """
+        Return parsed contents of the metrics files that may fall after cutoff_time.
+
+        Files named metrics_<YYYYmmddTHHMMSS>_<execution_id>.json are sorted
+        and bisected on that prefix. Legacy names are filtered by mtime
+        instead. Parsed files are kept in an on-disk index keyed by mtime,
+        so only new or modified files in range are opened and JSON-decoded.
+        Index entries older than the retention window are dropped.
+
+        `listing` is the result of _list_metrics_files.
+        """
+        entries, timestamped, legacy = listing
+        index = self._load_index()
+        kept = {}
+        scanned = {}
+        changed = False
+
+        retention_cutoff = min(cutoff_time, datetime.now() - timedelta(hours=self.INDEX_RETENTION_HOURS))
+        min_retained_mtime = retention_cutoff.timestamp() - self.MTIME_GUARD_SECONDS
+
+        # Timestamped files before the cutoff are out of range by name alone;
+        # those still inside the retention window stay in the index
+        first = bisect.bisect_left(timestamped, _cutoff_name(cutoff_time))
+        retained = bisect.bisect_left(timestamped, _cutoff_name(retention_cutoff), 0, first)
+        for name in timestamped[retained:first]:
+            if name in index:
+                kept[name] = index[name]
+
+        min_mtime = cutoff_time.timestamp() - self.MTIME_GUARD_SECONDS
+        to_read = []
+        # Legacy names first, then timestamped names in chronological order;
+        # files still to be read hold their slot so that order is preserved
+        for name in legacy + timestamped[first:]:
+            entry = entries[name]
+            mtime = entry.stat().st_mtime
+            cached = index.get(name)
+            if cached is not None and cached[0] == mtime:
+                if mtime >= min_retained_mtime:
+                    kept[name] = cached
+                if mtime >= min_mtime:
+                    scanned[name] = cached
+            elif mtime >= min_mtime:
+                to_read.append((name, entry.path, mtime))
+                scanned[name] = None
+
+        # File reads release the GIL, so overlap their latency across a thread pool
+        if to_read:
+            with ThreadPoolExecutor() as executor:
+                contents = list(executor.map(_read_metrics_file, [path for _, path, _ in to_read]))
+
+            for (name, path, mtime), raw in zip(to_read, contents):
+                if raw is None:
+                    del scanned[name]
+                    continue
+                try:
+                    kept[name] = scanned[name] = (mtime, json.loads(raw))
+                    changed = True
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not read metrics file {path}: {e}")
+                    del scanned[name]
+
+        # Rewrite the index when files were parsed or removed
+        if changed or len(kept) != len(index):
+            # Another dashboard may have rewritten the index since it was loaded;
+            # keep the entries it added instead of overwriting them
+            latest = self._load_index()
+            if latest is not index:
+                for name, cached in latest.items():
+                    if name not in kept and name in entries and cached[0] >= min_retained_mtime:
+                        kept[name] = cached
+            self._save_index(kept)
+
+        return scanned
+
+    def _load_window(self, hours: int,
+                     listing: Tuple[Dict[str, os.DirEntry], List[str], List[str]]) -> Tuple[List[Dict], np.ndarray, pd.DataFrame]:
+        """
+        Parse the metrics for a lookback window, sorted by timestamp.
+
+        Returns the records, their start times as epoch seconds and a
+        DataFrame of the summary columns, all in the same order.
+        """
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        recent_metrics = []
+        all_metrics = [data for _, data in self._scan_metrics(cutoff_time, listing).values() if isinstance(data, dict)]
+        if not all_metrics:
+            return [], np.empty(0), _metrics_frame([])
+
+        # Compare start times as epoch seconds against the cutoff in one pass
+        epochs = np.fromiter((_metrics_epoch(data) for data in all_metrics), dtype=np.float64, count=len(all_metrics))
+        unparseable = int(np.isnan(epochs).sum())
+        if unparseable:
+            logger.warning(f"⚠️ Skipping {unparseable} metrics entries without a valid timestamp")
+
+        in_range = np.flatnonzero(epochs >= cutoff_time.timestamp())
+
+        # Timestamped files are scanned in chronological order, so the sort is
+        # usually unnecessary; legacy names or same-second ties fall back to it
+        in_range_epochs = epochs[in_range]
+        if np.all(in_range_epochs[1:] >= in_range_epochs[:-1]):
+            order = in_range
+        else:
+            order = in_range[np.argsort(in_range_epochs, kind='stable')]
+        metrics = [all_metrics[i] for i in order]
+        return metrics, epochs[order], _metrics_frame(metrics)
+
+    def _recent_window(self, hours: int) -> Tuple[List[Dict], pd.DataFrame]:
+        """
+        Return the records and summary DataFrame for the last `hours` hours.
 
-        # Read all metrics files
-        for metrics_file in self.monitoring_dir.glob("metrics_*.json"):
-            try:
-                with open(metrics_file, 'r') as f:
-                    data = json.load(f)
+        Parsed windows are cached per instance, keyed on the number of metrics
+        files and their newest mtime: adding, removing or rewriting a file
+        (including the writer's rename into place) changes that key. The
+        cutoff is re-applied on every call, since a cached window can only be
+        wider than the current one.
+        """
+        listing = self._list_metrics_files()
+        entries = listing[0]
+        state = (len(entries), max((entry.stat().st_mtime_ns for entry in entries.values()), default=0))
 
-                # Parse timestamp and check if within range
-                timestamp = datetime.fromisoformat(data['timestamp'])
-                if timestamp >= cutoff_time:
-                    recent_metrics.append(data)
+        cached = self._window_cache.get(hours)
+        if cached is None or cached[0] != state:
+            cached = (state, self._load_window(hours, listing))
+            self._window_cache[hours] = cached
+
+        metrics, epochs, frame = cached[1]
+        first = int(epochs.searchsorted((datetime.now() - timedelta(hours=hours)).timestamp()))
+        return metrics[first:], frame.iloc[first:]
+
+    def load_recent_metrics(self, hours: int = 24) -> List[Dict]:
+        """Load metrics from recent pipeline executions."""
+        return self._recent_window(hours)[0]
 
-            except Exception as e:
-                logger.warning(f"⚠️ Could not read metrics file {metrics_file}: {e}")
+    def load_recent_metrics_frame(self, hours: int = 24) -> pd.DataFrame:
+        """
+        Load recent pipeline executions as a DataFrame of summary columns.
 
-        # Sort by timestamp
-        recent_metrics.sort(key=lambda x: x['timestamp'])
-        return recent_metrics
+        The frame is built once per window and shared, so treat it as read-only.
+        """
+        return self._recent_window(hours)[1]
 
-    def check_alerts(self, hours: int = 24) -> Dict[str, Any]:
+    def check_alerts(self, hours: int = 24,
+                     recent_metrics: Optional[Union[List[Dict], pd.DataFrame]] = None) -> Dict[str, Any]:
         """
         Check for alert conditions in recent pipeline executions.
 
         Args:
             hours: Number of hours to look back for alert checking
+            recent_metrics: Metrics already loaded for this window, as records or
+                a summary DataFrame (loaded if omitted)
 
         Returns:
             Dictionary containing alert status and triggered alerts
         """
-        recent_metrics = self.load_recent_metrics(hours)
+        if recent_metrics is None:
+            frame = self.load_recent_metrics_frame(hours)
+        elif isinstance(recent_metrics, pd.DataFrame):
+            frame = recent_metrics
+        else:
+            frame = _metrics_frame(recent_metrics)
+
         alerts = {
             'timestamp': datetime.now().isoformat(),
             'alert_status': 'GREEN',  # GREEN, YELLOW, RED
@@ -83,7 +377,7 @@ class GXDashboard:
             'recommendations': []
         }
 
-        if not recent_metrics:
+        if frame.empty:
             alerts['alert_status'] = 'YELLOW'
             alerts['alerts_triggered'].append({
                 'type': 'NO_DATA',
@@ -92,14 +386,15 @@ class GXDashboard:
             })
             return alerts
 
-        # Calculate aggregate metrics
-        total_executions = len(recent_metrics)
-        failed_executions = [m for m in recent_metrics if m.get('status') == 'FAILED']
-        success_rate = ((total_executions - len(failed_executions)) / total_executions) * 100
+        # Calculate aggregate metrics on the summary columns (missing values count as 0)
+        total_executions = len(frame)
+        failed_mask = frame['status'].eq('FAILED').to_numpy()
+        failed_executions = int(failed_mask.sum())
+        success_rate = ((total_executions - failed_executions) / total_executions) * 100
 
         # Average metrics
-        avg_duration = sum(m.get('duration_seconds', 0) for m in recent_metrics) / len(recent_metrics)
-        avg_transformation_rate = sum(m.get('transformation_success_rate', 0) for m in recent_metrics) / len(recent_metrics)
+        avg_duration = float(frame['duration_seconds'].fillna(0).mean())
+        avg_transformation_rate = float(frame['transformation_success_rate'].fillna(0).mean())
 
         # Store summary
         alerts['metrics_summary'] = {
@@ -107,57 +402,60 @@ class GXDashboard:
             'execution_success_rate': success_rate,
             'average_duration': avg_duration,
             'average_transformation_rate': avg_transformation_rate,
-            'failed_executions': len(failed_executions)
+            'failed_executions': failed_executions
         }
 
-        # Check alert thresholds
-        alert_level = 'GREEN'
+        # Check alert thresholds (bound once; the dict may be replaced by callers)
+        thresholds = self.alert_thresholds
+        min_success_rate = thresholds['min_success_rate']
+        max_duration = thresholds['max_duration_seconds']
+        severity = 0
 
         # 1. Check execution success rate
-        if success_rate < self.alert_thresholds['min_success_rate']:
-            alert_level = 'RED'
+        if success_rate < min_success_rate:
+            severity = 2
             alerts['alerts_triggered'].append({
                 'type': 'LOW_SUCCESS_RATE',
                 'severity': 'CRITICAL',
-                'message': f'Pipeline success rate is {success_rate:.1f}% (threshold: {self.alert_thresholds["min_success_rate"]}%)',
+                'message': f'Pipeline success rate is {success_rate:.1f}% (threshold: {min_success_rate}%)',
                 'value': success_rate,
-                'threshold': self.alert_thresholds['min_success_rate']
+                'threshold': min_success_rate
             })
 
         # 2. Check average duration
-        if avg_duration > self.alert_thresholds['max_duration_seconds']:
-            alert_level = max(alert_level, 'YELLOW')
+        if avg_duration > max_duration:
+            severity = max(severity, 1)
             alerts['alerts_triggered'].append({
                 'type': 'SLOW_PERFORMANCE',
                 'severity': 'WARNING',
-                'message': f'Average pipeline duration is {avg_duration:.1f}s (threshold: {self.alert_thresholds["max_duration_seconds"]}s)',
+                'message': f'Average pipeline duration is {avg_duration:.1f}s (threshold: {max_duration}s)',
                 'value': avg_duration,
-                'threshold': self.alert_thresholds['max_duration_seconds']
+                'threshold': max_duration
             })
 
         # 3. Check transformation success rate
-        if avg_transformation_rate < self.alert_thresholds['min_success_rate']:
-            alert_level = max(alert_level, 'YELLOW')
+        if avg_transformation_rate < min_success_rate:
+            severity = max(severity, 1)
             alerts['alerts_triggered'].append({
                 'type': 'LOW_TRANSFORMATION_RATE',
                 'severity': 'WARNING',
-                'message': f'Average transformation rate is {avg_transformation_rate:.1f}% (threshold: {self.alert_thresholds["min_success_rate"]}%)',
+                'message': f'Average transformation rate is {avg_transformation_rate:.1f}% (threshold: {min_success_rate}%)',
                 'value': avg_transformation_rate,
-                'threshold': self.alert_thresholds['min_success_rate']
+                'threshold': min_success_rate
             })
 
         # 4. Check for recent failures
-        recent_failures = [m for m in recent_metrics[-5:] if m.get('status') == 'FAILED']
-        if len(recent_failures) >= 2:
-            alert_level = 'RED'
+        recent_failures = int(failed_mask[-5:].sum())
+        if recent_failures >= 2:
+            severity = 2
             alerts['alerts_triggered'].append({
                 'type': 'REPEATED_FAILURES',
                 'severity': 'CRITICAL',
-                'message': f'Multiple recent failures detected ({len(recent_failures)} in last 5 executions)',
-                'value': len(recent_failures)
+                'message': f'Multiple recent failures detected ({recent_failures} in last 5 executions)',
+                'value': recent_failures
             })
 
-        alerts['alert_status'] = alert_level
+        alerts['alert_status'] = self._SEVERITY_NAMES[severity]
 
         # Generate recommendations
         if alerts['alerts_triggered']:
@@ -167,33 +465,12 @@ class GXDashboard:
 
     def _generate_recommendations(self, triggered_alerts: List[Dict]) -> List[str]:
         """Generate actionable recommendations based on triggered alerts."""
-        recommendations = []
-
+        # Collect each alert type's recommendations, dropping duplicates while preserving order
+        recommendations = {}
         for alert in triggered_alerts:
-            alert_type = alert['type']
-
-            if alert_type == 'LOW_SUCCESS_RATE':
-                recommendations.append("🔧 Review failed pipeline executions and check data source quality")
-                recommendations.append("📊 Consider adjusting transformation expectations for problematic fields")
-
-            elif alert_type == 'SLOW_PERFORMANCE':
-                recommendations.append("⚡ Consider optimizing data processing for large datasets")
-                recommendations.append("🧪 Test with smaller data samples to identify bottlenecks")
-
-            elif alert_type == 'LOW_TRANSFORMATION_RATE':
-                recommendations.append("🎯 Review desired schema definitions for accuracy")
-                recommendations.append("📋 Check if new data patterns require schema updates")
+            recommendations.update(dict.fromkeys(ALERT_RECOMMENDATIONS.get(alert['type'], ())))
 
-            elif alert_type == 'REPEATED_FAILURES':
-                recommendations.append("🚨 URGENT: Investigate root cause of pipeline failures")
-                recommendations.append("🛡️ Consider implementing fallback data processing")
-
-            elif alert_type == 'NO_DATA':
-                recommendations.append("📈 Verify pipeline scheduling and execution")
-                recommendations.append("🔍 Check for system-level issues preventing execution")
-
-        # Remove duplicates while preserving order
-        return list(dict.fromkeys(recommendations))
+        return list(recommendations)
 
     def generate_health_report(self, hours: int = 24) -> str:
         """
@@ -205,8 +482,8 @@ class GXDashboard:
         Returns:
             Formatted health report string
         """
-        alerts = self.check_alerts(hours)
-        recent_metrics = self.load_recent_metrics(hours)
+        recent_metrics, frame = self._recent_window(hours)
+        alerts = self.check_alerts(hours, recent_metrics=frame)
 
         # Status emoji mapping
         status_emoji = {
@@ -215,7 +492,7 @@ class GXDashboard:
             'RED': '🚨'
         }
 
-        report = f"""
+        parts = [f"""
 🔍 GX PIPELINE HEALTH REPORT
 {'=' * 50}
 📅 Report Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -227,36 +504,35 @@ class GXDashboard:
    Success Rate: {alerts['metrics_summary'].get('execution_success_rate', 0):.1f}%
    Avg Duration: {alerts['metrics_summary'].get('average_duration', 0):.2f}s
    Avg Transformation Rate: {alerts['metrics_summary'].get('average_transformation_rate', 0):.1f}%
-"""
+"""]
 
         # Add alerts section
         if alerts['alerts_triggered']:
-            report += f"\n🚨 ACTIVE ALERTS ({len(alerts['alerts_triggered'])}):\n"
+            parts.append(f"\n🚨 ACTIVE ALERTS ({len(alerts['alerts_triggered'])}):\n")
             for i, alert in enumerate(alerts['alerts_triggered'], 1):
                 severity_emoji = '🚨' if alert['severity'] == 'CRITICAL' else '⚠️'
-                report += f"   {i}. {severity_emoji} {alert['type']}: {alert['message']}\n"
+                parts.append(f"   {i}. {severity_emoji} {alert['type']}: {alert['message']}\n")
         else:
-            report += "\n✅ NO ACTIVE ALERTS\n"
+            parts.append("\n✅ NO ACTIVE ALERTS\n")
 
         # Add recommendations
         if alerts['recommendations']:
-            report += f"\n💡 RECOMMENDATIONS:\n"
-            for rec in alerts['recommendations']:
-                report += f"   • {rec}\n"
+            parts.append("\n💡 RECOMMENDATIONS:\n")
+            parts.extend(f"   • {rec}\n" for rec in alerts['recommendations'])
 
         # Add recent execution summary
         if recent_metrics:
-            report += f"\n📋 RECENT EXECUTIONS:\n"
+            parts.append("\n📋 RECENT EXECUTIONS:\n")
             for metric in recent_metrics[-3:]:  # Last 3 executions
                 status_icon = '✅' if metric.get('status') == 'SUCCESS' else '❌'
                 timestamp = datetime.fromisoformat(metric['timestamp']).strftime('%H:%M:%S')
                 dataset = metric.get('dataset_name', 'unknown')
                 duration = metric.get('duration_seconds', 0)
-                report += f"   {status_icon} {timestamp} - {dataset} ({duration:.2f}s)\n"
+                parts.append(f"   {status_icon} {timestamp} - {dataset} ({duration:.2f}s)\n")
 
-        report += f"\n{'=' * 50}\n"
+        parts.append(f"\n{'=' * 50}\n")
 
-        return report
+        return "".join(parts)
 
     def export_metrics_to_csv(self, hours: int = 168, output_file: str = "gx_metrics_export.csv") -> str:
         """
@@ -275,32 +551,19 @@ class GXDashboard:
             logger.warning("No metrics data available for export")
             return None
 
-        # Flatten metrics for CSV export
-        flattened_data = []
-        for metric in recent_metrics:
-            row = {
-                'timestamp': metric.get('timestamp'),
-                'dataset_name': metric.get('dataset_name'),
-                'execution_id': metric.get('execution_id'),
-                'status': metric.get('status'),
-                'duration_seconds': metric.get('duration_seconds'),
-                'input_rows': metric.get('input_rows'),
-                'output_rows': metric.get('output_rows'),
-                'input_columns': metric.get('input_columns'),
-                'output_columns': metric.get('output_columns'),
-                'transformations_attempted': metric.get('transformations_attempted'),
-                'transformations_successful': metric.get('transformations_successful'),
-                'transformation_success_rate': metric.get('transformation_success_rate'),
-                'error_count': len(metric.get('errors', [])),
-                'warning_count': len(metric.get('warnings', []))
-            }
-            flattened_data.append(row)
-
-        # Create DataFrame and export
-        df = pd.DataFrame(flattened_data)
-
+        # Stream rows straight to disk rather than building an intermediate table
         output_path = self.monitoring_dir / output_file
-        df.to_csv(output_path, index=False)
+        with open(output_path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=EXPORT_COLUMNS + ['error_count', 'warning_count'], lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(
+                {
+                    **{column: metric.get(column) for column in EXPORT_COLUMNS},
+                    'error_count': len(metric.get('errors', [])),
+                    'warning_count': len(metric.get('warnings', []))
+                }
+                for metric in recent_metrics
+            )
 
         logger.info(f"📊 Metrics exported to {output_path}")
         return str(output_path)
@@ -348,10 +611,10 @@ def print_health_report(hours: int = 24):
 if __name__ == "__main__":
     # Example usage
     print("🔍 GX Pipeline Health Check")
-    print_health_report(24)
-
-    # Export metrics
     dashboard = create_dashboard()
+    print(dashboard.generate_health_report(24))
+
+    # Export metrics (same dashboard, so its index and window caches are reused)
     csv_path = dashboard.export_metrics_to_csv(168)  # 1 week of data
     if csv_path:
         print(f"📊 Metrics exported to: {csv_path}")
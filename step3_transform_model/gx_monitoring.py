@@ -5,20 +5,143 @@ Provides comprehensive monitoring, logging, and error handling for the
 Great Expectations data cleaning pipeline.
 """
 
+import atexit
+import bisect
 import logging
+import os
+import queue
+import re
+import threading
 import time
 import json
 import traceback
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Metrics files are named metrics_<YYYYmmddTHHMMSS>_<execution_id>.json, so a
+# sorted listing is chronological and out-of-window files can be skipped by name
+METRICS_TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S"
+TIMESTAMPED_METRICS_RE = re.compile(r"metrics_\d{8}T\d{6}_")
+
+# Leading "timestamp" key of a metrics record (PipelineMetrics declares it first)
+LEADING_TIMESTAMP_RE = re.compile(r'\s*\{\s*"timestamp":\s*"([^"]*)"')
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that block-buffers records instead of flushing after each one.
+
+    The stream is flushed on records at WARNING or above, every `flush_every`
+    records, on the first record more than `flush_interval` seconds after the
+    last flush (so a quiet run does not hold lines back), and when the handler
+    is closed (logging.shutdown at exit).
+    """
+
+    def __init__(self, filename, flush_every: int = 100, buffer_size: int = 64 * 1024,
+                 flush_interval: float = 5.0, **kwargs):
+        self.flush_every = flush_every
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        super().__init__(filename, **kwargs)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if (record.levelno >= logging.WARNING or self._pending >= self.flush_every
+                    or time.monotonic() - self._last_flush > self.flush_interval):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        super().flush()
+
+def _to_record(instance) -> Dict[str, Any]:
+    """
+    Shallow dict of a metrics dataclass for JSON serialization.
+
+    Unlike dataclasses.asdict this does not deep-copy every value; only the
+    error and warning lists are copied, since they may still grow.
+    """
+    record = {}
+    for field in fields(instance):
+        value = getattr(instance, field.name)
+        record[field.name] = list(value) if isinstance(value, list) else value
+    return record
+
+# Metrics files from every monitor in the process go through one queue and one
+# daemon writer thread, started on first use and drained once at exit
+_write_queue: queue.Queue = queue.Queue()
+_writer_lock = threading.Lock()
+_writer_thread: Optional[threading.Thread] = None
+_atexit_registered = False
+
+def _reset_writer_after_fork():
+    """Give a forked child its own queue; the parent's writer thread does not exist there."""
+    global _write_queue, _writer_lock, _writer_thread
+    _write_queue = queue.Queue()
+    _writer_lock = threading.Lock()
+    _writer_thread = None
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_writer_after_fork)
+
+def _enqueue_metrics_write(metrics_file: Path, record: Dict[str, Any]):
+    """Queue a metrics record for the shared writer thread, starting it if needed."""
+    global _writer_thread, _atexit_registered
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_writer_loop, name="gx-metrics-writer", daemon=True)
+            _writer_thread.start()
+        if not _atexit_registered:
+            atexit.register(flush_metrics)
+            _atexit_registered = True
+    _write_queue.put((metrics_file, record))
+
+def flush_metrics():
+    """Block until every queued metrics file has been written."""
+    _write_queue.join()
+
+def _writer_loop():
+    """Write queued metrics files, one compact JSON line per execution."""
+    while True:
+        metrics_file, record = _write_queue.get()
+        try:
+            # Write under a temporary name and rename into place, so readers
+            # never see an empty or partly written metrics file
+            tmp_file = metrics_file.with_name(f".{metrics_file.name}.tmp")
+            with open(tmp_file, 'w') as f:
+                f.write(json.dumps(record, default=str) + "\n")
+            os.replace(tmp_file, metrics_file)
+
+            logger.info(f"💾 Metrics saved to {metrics_file}")
+
+        except Exception as e:
+            logger.error(f"❌ Failed to save metrics: {e}")
+
+        finally:
+            _write_queue.task_done()
+
+@dataclass(slots=True)
 class PipelineMetrics:
     """Data class for tracking pipeline execution metrics."""
 
@@ -54,13 +177,16 @@ class PipelineMetrics:
     warnings: List[str] = None
     status: str = "RUNNING"  # RUNNING, SUCCESS, FAILED, WARNING
 
+    # Start time as epoch seconds, so readers can filter without parsing `timestamp`
+    timestamp_epoch: Optional[float] = None
+
     def __post_init__(self):
         if self.errors is None:
             self.errors = []
         if self.warnings is None:
             self.warnings = []
 
-@dataclass
+@dataclass(slots=True)
 class DataQualityScore:
     """Data class for tracking data quality scores."""
 
@@ -119,9 +245,15 @@ class GXPipelineMonitor:
 
         # Create monitoring log file
         log_file = self.log_directory / f"gx_monitoring_{datetime.now().strftime('%Y%m%d')}.log"
+        monitor_logger = logging.getLogger('gx_monitoring')
+
+        # Monitors sharing a log file share one handler, so records are not written twice
+        if any(isinstance(handler, BufferedFileHandler) and handler.baseFilename == os.path.abspath(log_file)
+               for handler in monitor_logger.handlers):
+            return
 
-        # Configure logging
-        monitoring_handler = logging.FileHandler(log_file)
+        # Configure logging; records are block-buffered rather than flushed one by one
+        monitoring_handler = BufferedFileHandler(log_file)
         monitoring_handler.setLevel(logging.INFO)
 
         formatter = logging.Formatter(
@@ -130,7 +262,6 @@ class GXPipelineMonitor:
         monitoring_handler.setFormatter(formatter)
 
         # Add handler to logger
-        monitor_logger = logging.getLogger('gx_monitoring')
         monitor_logger.addHandler(monitoring_handler)
         monitor_logger.setLevel(logging.INFO)
 
@@ -144,10 +275,12 @@ class GXPipelineMonitor:
         Returns:
             execution_id: Unique ID for this execution
         """
-        execution_id = f"{dataset_name}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        started_at = datetime.now()
+        execution_id = f"{dataset_name}_{started_at.strftime('%Y%m%d_%H%M%S_%f')}"
 
         metrics = PipelineMetrics(
-            timestamp=datetime.now().isoformat(),
+            timestamp=started_at.isoformat(),
+            timestamp_epoch=started_at.timestamp(),
             dataset_name=dataset_name,
             execution_id=execution_id,
             start_time=time.time(),
@@ -175,13 +308,11 @@ class GXPipelineMonitor:
         metrics = self.current_metrics[execution_id]
 
         # Input metrics
-        metrics.input_rows = len(input_df)
-        metrics.input_columns = len(input_df.columns)
+        metrics.input_rows, metrics.input_columns = input_df.shape
 
         # Output metrics
         if output_df is not None:
-            metrics.output_rows = len(output_df)
-            metrics.output_columns = len(output_df.columns)
+            metrics.output_rows, metrics.output_columns = output_df.shape
 
         logger.info(f"📊 Data metrics - Input: {metrics.input_rows}x{metrics.input_columns}, "
                    f"Output: {metrics.output_rows}x{metrics.output_columns}")
@@ -277,8 +408,11 @@ class GXPipelineMonitor:
         metrics = self.current_metrics[execution_id]
 
         # Calculate quality dimensions
-        total_cells = len(df) * len(df.columns)
-        null_cells = df.isnull().sum().sum()
+        n_rows, n_cols = df.shape
+        total_cells = n_rows * n_cols
+        # Count nulls column by column, so only one column's mask exists at a time
+        # rather than a boolean frame the size of df
+        null_cells = sum(np.count_nonzero(column.isna().to_numpy()) for _, column in df.items())
 
         completeness_score = ((total_cells - null_cells) / total_cells) * 100 if total_cells > 0 else 0
 
@@ -307,7 +441,7 @@ class GXPipelineMonitor:
             consistency_score=consistency_score,
             timeliness_score=timeliness_score,
             overall_quality_score=overall_score,
-            total_records=len(df),
+            total_records=n_rows,
             null_records=int(null_cells),
             type_conversion_errors=len(metrics.errors)
         )
@@ -355,18 +489,19 @@ class GXPipelineMonitor:
         return metrics
 
     def save_metrics(self, metrics: PipelineMetrics):
-        """Save metrics to JSON file for historical tracking."""
-
-        metrics_file = self.log_directory / f"metrics_{metrics.execution_id}.json"
+        """Queue metrics to be saved to a JSON file for historical tracking."""
 
-        try:
-            with open(metrics_file, 'w') as f:
-                json.dump(asdict(metrics), f, indent=2, default=str)
+        # Timestamp prefix keeps the files in chronological order by name (GXDashboard bisects on it)
+        stamp = datetime.fromisoformat(metrics.timestamp).strftime(METRICS_TIMESTAMP_FORMAT)
+        metrics_file = self.log_directory / f"metrics_{stamp}_{metrics.execution_id}.json"
 
-            logger.info(f"💾 Metrics saved to {metrics_file}")
+        # Snapshot the fields now; the shared writer thread serializes and writes
+        # them, so finishing a pipeline never waits on serialization or disk
+        _enqueue_metrics_write(metrics_file, _to_record(metrics))
 
-        except Exception as e:
-            logger.error(f"❌ Failed to save metrics: {e}")
+    def flush_metrics(self):
+        """Block until every queued metrics file has been written."""
+        flush_metrics()
 
     def get_recent_metrics(self, hours: int = 24) -> List[PipelineMetrics]:
         """
@@ -378,14 +513,32 @@ class GXPipelineMonitor:
         Returns:
             List of recent PipelineMetrics
         """
+        # Include executions whose metrics are still queued for writing
+        self.flush_metrics()
+
         cutoff_time = datetime.now() - timedelta(hours=hours)
         recent_metrics = []
 
-        # Read metrics files
-        for metrics_file in self.log_directory.glob("metrics_*.json"):
+        # Timestamped files older than the cutoff are skipped by name; legacy
+        # names carry no timestamp and are always read
+        names = sorted(path.name for path in self.log_directory.glob("metrics_*.json"))
+        timestamped = [name for name in names if TIMESTAMPED_METRICS_RE.match(name)]
+        legacy = [name for name in names if not TIMESTAMPED_METRICS_RE.match(name)]
+        first = bisect.bisect_left(timestamped, f"metrics_{cutoff_time.strftime(METRICS_TIMESTAMP_FORMAT)}")
+
+        for name in legacy + timestamped[first:]:
+            metrics_file = self.log_directory / name
             try:
                 with open(metrics_file, 'r') as f:
-                    data = json.load(f)
+                    raw = f.read()
+
+                # Records that lead with their timestamp are range-checked before
+                # decoding, so out-of-window files are never parsed as JSON
+                match = LEADING_TIMESTAMP_RE.match(raw)
+                if match and datetime.fromisoformat(match.group(1)) < cutoff_time:
+                    continue
+
+                data = json.loads(raw)
 
                 # Check if within time range
                 timestamp = datetime.fromisoformat(data['timestamp'])
@@ -434,7 +587,7 @@ class GXPipelineMonitor:
                 'average_duration_seconds': avg_duration,
                 'average_transformation_success_rate': avg_success_rate
             },
-            'quality_scores': [asdict(score) for score in self.quality_scores[-10:]]  # Last 10 scores
+            'quality_scores': [_to_record(score) for score in self.quality_scores[-10:]]  # Last 10 scores
         }
 
         return report
@@ -1,4 +1,4 @@
-he f"""
+"""
 Production Monitoring Example for GX Pipeline
 
 This example shows how to integrate monitoring and alerting into your
@@ -57,6 +57,9 @@ def run_monitored_pipeline():
 
             print(f"✅ {dataset_name} processed: {cleaned_df.shape}")
 
+        # Metrics files are written in the background; make sure they are on disk
+        cleaner.monitor.flush_metrics()
+
         # Check health status after processing
         print("\n🔍 CHECKING PIPELINE HEALTH...")
         health_status = check_pipeline_health(1)  # Last 1 hour
@@ -150,12 +153,19 @@ def monitor_specific_dataset(dataset_name: str, hours: int = 24):
         print(f"❌ No recent data found for {dataset_name}")
         return
 
-    print(f"📊 Found {len(dataset_metrics)} executions for {dataset_name}")
+    n_executions = len(dataset_metrics)
+    print(f"📊 Found {n_executions} executions for {dataset_name}")
+
+    # Calculate dataset-specific stats in one pass over the executions
+    successes = total_duration = total_transform_rate = 0
+    for m in dataset_metrics:
+        successes += m.get('status') == 'SUCCESS'
+        total_duration += m.get('duration_seconds', 0)
+        total_transform_rate += m.get('transformation_success_rate', 0)
 
-    # Calculate dataset-specific stats
-    success_rate = len([m for m in dataset_metrics if m.get('status') == 'SUCCESS']) / len(dataset_metrics) * 100
-    avg_duration = sum(m.get('duration_seconds', 0) for m in dataset_metrics) / len(dataset_metrics)
-    avg_transform_rate = sum(m.get('transformation_success_rate', 0) for m in dataset_metrics) / len(dataset_metrics)
+    success_rate = successes / n_executions * 100
+    avg_duration = total_duration / n_executions
+    avg_transform_rate = total_transform_rate / n_executions
 
     print(f"\n📈 DATASET PERFORMANCE:")
     print(f"   Success Rate: {success_rate:.1f}%")
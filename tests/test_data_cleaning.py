@@ -0,0 +1,136 @@
+"""
+Tests for the smart data cleaner in step3_transform_model
+Tests schema validation and that cleaning never modifies the caller's frame
+"""
+
+import unittest
+import contextlib
+import io
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add paths for imports
+sys.path.append(str(Path(__file__).parent.parent / "step3_transform_model"))
+import gx_data_cleaning
+from gx_data_cleaning import SmartDataCleaner
+
+
+def quiet(func, *args, **kwargs):
+    """Call func with the cleaner's progress output suppressed."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+def make_permits_frame() -> pd.DataFrame:
+    """Small cleaned building permits frame with a mix of passing and failing values."""
+    return pd.DataFrame({
+        'permit_': ['B100', 'B200', None, 'B300'],
+        'issue_date': pd.to_datetime(['2023-01-05', None, '2023-03-01', '2023-04-01']),
+        'processing_time': pd.array([5, 4000, None, 7], dtype='Int64'),
+        'total_fee': [10.0, -1.0, None, 3.5],
+        'community_area': pd.array([1, 80, 3, None], dtype='Int64'),
+    })
+
+
+class TestFastValidate(unittest.TestCase):
+    """Test the pandas validation path against Great Expectations"""
+
+    def setUp(self):
+        self.cleaner = SmartDataCleaner(enable_monitoring=False, enable_gx=False)
+
+    @unittest.skipUnless(gx_data_cleaning.GX_AVAILABLE, "great_expectations not installed")
+    def test_matches_gx_validation(self):
+        """Test _fast_validate reaches the same verdicts as validate_with_gx"""
+        import great_expectations as gx
+        self.cleaner.context = gx.get_context(mode="ephemeral")
+        df = make_permits_frame()
+
+        gx_results = quiet(self.cleaner.validate_with_gx, df, 'building_permits')
+        fast_results = quiet(self.cleaner.validate, df, 'building_permits')
+        self.assertIsNotNone(gx_results)
+
+        fast_outcomes = {(r['expectation_type'], r['column']): r['success']
+                         for r in fast_results['results']}
+        gx_outcomes = {(r.expectation_config.type, r.expectation_config.kwargs.get('column', 'table')): r.success
+                       for r in gx_results['results'].results}
+
+        # GX may collapse duplicate-looking expectations, so compare per expectation
+        for key, success in gx_outcomes.items():
+            self.assertEqual(fast_outcomes.get(key), success, key)
+        self.assertEqual(fast_results['success'], gx_results['success'])
+        self.assertEqual({key for key, success in fast_outcomes.items() if not success},
+                         {key for key, success in gx_outcomes.items() if not success})
+
+    def test_reports_failed_expectations(self):
+        """Test failing columns are reported without Great Expectations"""
+        results = quiet(self.cleaner.validate, make_permits_frame(), 'building_permits')
+
+        failed = {(r['expectation_type'], r['column']) for r in results['results'] if not r['success']}
+        self.assertFalse(results['success'])
+        self.assertIn(('expect_column_values_to_not_be_null', 'permit_'), failed)
+        self.assertIn(('expect_column_values_to_be_between', 'total_fee'), failed)
+        self.assertEqual(results['failed_expectations'], len(failed))
+
+
+class TestSmartCleaning(unittest.TestCase):
+    """Test smart cleaning leaves its input alone"""
+
+    def setUp(self):
+        self.cleaner = SmartDataCleaner(enable_monitoring=False, enable_gx=False)
+
+    def test_input_frame_untouched(self):
+        """Test execute_smart_cleaning does not modify the frame it is given"""
+        df = pd.DataFrame({
+            'license_id': [1.0, 2.0, np.nan],
+            'legal_name': ['Foo ', ' bar', None],
+            'zip_code': ['60601', '60602-1234', 'abc'],
+            'community_area': ['1', '78', None],
+            'latitude': ['41.88', '43.0', None],
+            'longitude': ['-87.6', '-87.7', ''],
+            'license_start_date': ['2023-01-05T00:00:00.000', None, '2022-03-01T00:00:00.000'],
+        })
+        original = df.copy(deep=True)
+
+        cleaned = quiet(self.cleaner.execute_smart_cleaning, df, 'business_licenses')
+
+        pd.testing.assert_frame_equal(df, original)
+        self.assertEqual(str(cleaned['community_area'].dtype), 'Int64')
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(cleaned['license_start_date']))
+
+
+class TestBusinessRules(unittest.TestCase):
+    """Test business rules applied during cleaning"""
+
+    def setUp(self):
+        self.cleaner = SmartDataCleaner(enable_monitoring=False, enable_gx=False)
+
+    def test_coordinates_share_one_mask(self):
+        """Test a point outside either coordinate bound is nulled as a whole"""
+        df = pd.DataFrame({
+            'latitude': [41.88, 43.0, 41.70, np.nan, 41.90],
+            'longitude': [-87.60, -87.60, -88.50, -87.70, np.nan],
+            'community_area': pd.array([1, 2, 3, 4, 90], dtype='Int64'),
+        })
+
+        result = quiet(self.cleaner._apply_business_rules, df.copy(deep=False), 'business_licenses')
+
+        np.testing.assert_array_equal(result['latitude'].to_numpy(), [41.88, np.nan, np.nan, np.nan, 41.90])
+        np.testing.assert_array_equal(result['longitude'].to_numpy(), [-87.60, np.nan, np.nan, -87.70, np.nan])
+        self.assertTrue(result['community_area'].isna().iloc[4])
+        # The caller's columns are replaced, not written into
+        self.assertEqual(df['latitude'].iloc[1], 43.0)
+
+    def test_lone_coordinate_column(self):
+        """Test a coordinate column without its pair is checked against its own bounds"""
+        df = pd.DataFrame({'latitude': [41.88, 43.0]})
+
+        result = quiet(self.cleaner._apply_business_rules, df.copy(deep=False), 'business_licenses')
+
+        np.testing.assert_array_equal(result['latitude'].to_numpy(), [41.88, np.nan])
+
+
+if __name__ == '__main__':
+    unittest.main()
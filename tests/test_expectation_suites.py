@@ -0,0 +1,46 @@
+"""
+Tests for the pre-built Chicago expectation suites in step3_transform_model
+Tests that dataset validation reports errors instead of raising
+"""
+
+import unittest
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+try:
+    import great_expectations as gx
+    GX_AVAILABLE = True
+except ImportError:
+    GX_AVAILABLE = False
+
+# Add paths for imports
+sys.path.append(str(Path(__file__).parent.parent / "step3_transform_model"))
+if GX_AVAILABLE:
+    from expectation_suites import validate_chicago_dataset, _suite_is_current
+
+
+@unittest.skipUnless(GX_AVAILABLE, "great_expectations not installed")
+class TestValidateChicagoDataset(unittest.TestCase):
+    """Test validate_chicago_dataset against an in-memory GX context"""
+
+    def setUp(self):
+        self.context = gx.get_context(mode="ephemeral")
+
+    def test_missing_suite_is_not_current(self):
+        """Test a suite that was never built is reported as stale"""
+        self.assertFalse(_suite_is_current(self.context, "cta_boardings_chicago_smb_suite"))
+
+    def test_returns_result_dict(self):
+        """Test validation returns a result or error dict rather than raising"""
+        df = pd.DataFrame({"route": ["1", "2"], "rides": [100, 200]})
+
+        result = validate_chicago_dataset(df, "cta_boardings", self.context)
+
+        self.assertIsInstance(result, dict)
+        self.assertTrue("error" in result or "validation_success" in result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tests for the GX monitoring dashboard in step3_transform_model
+Tests the recent-metrics window over legacy and timestamped metrics files
+"""
+
+import unittest
+import tempfile
+import os
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+# Add paths for imports
+sys.path.append(str(Path(__file__).parent.parent / "step3_transform_model"))
+from gx_dashboard import GXDashboard
+from gx_monitoring import METRICS_TIMESTAMP_FORMAT
+
+
+class TestRecentMetricsWindow(unittest.TestCase):
+    """Test which metrics files fall inside the dashboard window"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name)
+        self.now = datetime.now()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_metrics(self, name: str, hours_ago: float, legacy: bool = False,
+                      status: str = "SUCCESS") -> Path:
+        """Write a metrics file as the monitor would, or in the old untimestamped form."""
+        timestamp = self.now - timedelta(hours=hours_ago)
+        if legacy:
+            path = self.directory / f"metrics_{name}.json"
+        else:
+            path = self.directory / f"metrics_{timestamp.strftime(METRICS_TIMESTAMP_FORMAT)}_{name}.json"
+        path.write_text(json.dumps({
+            "timestamp": timestamp.isoformat(),
+            "dataset_name": name,
+            "status": status,
+            "duration_seconds": 1.0,
+            "transformation_success_rate": 90.0
+        }))
+        # Legacy files are windowed by modification time
+        os.utime(path, (timestamp.timestamp(), timestamp.timestamp()))
+        return path
+
+    def test_window_mixes_legacy_and_timestamped_files(self):
+        """Test recent files of both kinds are loaded and old ones skipped"""
+        self.write_metrics("old_run", 30)
+        self.write_metrics("recent_run", 2)
+        self.write_metrics("latest_run", 1, status="FAILED")
+        self.write_metrics("old_legacy", 400, legacy=True)
+        self.write_metrics("recent_legacy", 3, legacy=True)
+
+        dashboard = GXDashboard(str(self.directory))
+        names = {m["dataset_name"] for m in dashboard.load_recent_metrics(24)}
+
+        self.assertEqual(names, {"recent_run", "latest_run", "recent_legacy"})
+        self.assertEqual(
+            {m["dataset_name"] for m in dashboard.load_recent_metrics(48)},
+            {"old_run", "recent_run", "latest_run", "recent_legacy"}
+        )
+
+    def test_window_sees_new_files(self):
+        """Test a file written after the first load appears in the next one"""
+        self.write_metrics("recent_run", 2)
+        dashboard = GXDashboard(str(self.directory))
+        self.assertEqual(len(dashboard.load_recent_metrics(24)), 1)
+
+        self.write_metrics("new_run", 0.5)
+        names = {m["dataset_name"] for m in dashboard.load_recent_metrics(24)}
+        self.assertEqual(names, {"recent_run", "new_run"})
+
+    def test_missing_directory(self):
+        """Test a dashboard over a missing directory reports no metrics"""
+        dashboard = GXDashboard(str(self.directory / "missing"))
+        self.assertEqual(dashboard.load_recent_metrics(24), [])
+
+
+if __name__ == '__main__':
+    unittest.main()